@@ -0,0 +1,25 @@
+"""Timing/stat helpers shared by the benchmark modules."""
+from __future__ import annotations
+
+import socket
+import statistics
+from typing import Any, Dict, List
+
+
+def _stats(samples: List[float]) -> Dict[str, Any]:
+    ms = sorted(s * 1000.0 for s in samples)
+    return {
+        "n": len(ms),
+        "min_ms": round(ms[0], 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+        "stdev_ms": round(statistics.stdev(ms), 4) if len(ms) > 1 else 0.0,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
@@ -0,0 +1,161 @@
+"""
+Fixture-replay stand-in for QiskitRuntimeService / IBMBackend.
+
+Each fixture file in benchmarks/fixtures/ holds the status, configuration
+and properties payloads of one backend, in the shape returned by the
+runtime's `to_dict()` methods. The fake replays them with an optional
+per-call latency so the client code can be exercised without an
+IBM_QUANTUM_API_TOKEN.
+
+The shipped ibm_brisbane / ibm_kolkata fixtures are synthetic: hand-shaped
+payloads with random calibration values, not recordings of a live account.
+They are faithful in size and layout (qubit/gate counts, Nduv entries) but
+not in detail - e.g. coupling maps list each edge in one direction only and
+are a chain plus a few rungs rather than the real heavy-hex lattice, and
+configurations omit most real fields. Numbers from them are good for
+comparing runs of this suite, not as absolute per-device costs; record real
+fixtures with benchmarks/record.py for that.
+"""
+from __future__ import annotations
+
+import copy
+import glob
+import json
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# same SI prefixes BackendProperties applies when reading a property
+_UNIT_SCALE = {"": 1.0, "s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9, "GHz": 1e9, "MHz": 1e6}
+
+
+def load_fixtures(path: str = FIXTURES_DIR) -> List[Dict[str, Any]]:
+    fixtures = []
+    for fn in sorted(glob.glob(os.path.join(path, "*.json"))):
+        with open(fn) as f:
+            fixtures.append(json.load(f))
+    if not fixtures:
+        raise RuntimeError(f"no backend fixtures found in {path}")
+    return fixtures
+
+
+def _scaled(entry: Dict[str, Any]) -> float:
+    return float(entry["value"]) * _UNIT_SCALE.get(entry.get("unit", ""), 1.0)
+
+
+class FakeProperties:
+    """Read-only subset of BackendProperties used by IBMQuantumClient."""
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.backend_name = payload.get("backend_name")
+        self.last_update_date = payload.get("last_update_date")
+        self.qubits: List[List[Dict[str, Any]]] = payload.get("qubits", [])
+        self._qubit_props: List[Dict[str, Dict[str, Any]]] = [
+            {p["name"]: p for p in q} for q in self.qubits
+        ]
+        self._gates: Dict[Tuple[str, Tuple[int, ...]], Dict[str, Any]] = {}
+        for g in payload.get("gates", []):
+            params = {p["name"]: p for p in g.get("parameters", [])}
+            self._gates[(g["gate"], tuple(g["qubits"]))] = params
+
+    def _qubit_property(self, qubit: int, name: str) -> float:
+        try:
+            return _scaled(self._qubit_props[qubit][name])
+        except (IndexError, KeyError):
+            raise KeyError(f"couldn't find property {name} for qubit {qubit}") from None
+
+    def t1(self, qubit: int) -> float:
+        return self._qubit_property(qubit, "T1")
+
+    def t2(self, qubit: int) -> float:
+        return self._qubit_property(qubit, "T2")
+
+    def readout_error(self, qubit: int) -> float:
+        return self._qubit_property(qubit, "readout_error")
+
+    def gate_error(self, gate: str, qubits: List[int]) -> float:
+        try:
+            return _scaled(self._gates[(gate, tuple(qubits))]["gate_error"])
+        except KeyError:
+            raise KeyError(f"couldn't find gate_error for {gate} on {qubits}") from None
+
+
+class FakeBackend:
+    def __init__(self, fixture: Dict[str, Any], latency: float = 0.0) -> None:
+        self.name: str = fixture["name"]
+        self._latency = latency
+        self._status = fixture["status"]
+        self._configuration = fixture["configuration"]
+        self._properties = fixture.get("properties")
+
+    def _wait(self) -> None:
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+    def status(self) -> SimpleNamespace:
+        self._wait()
+        return SimpleNamespace(**self._status)
+
+    def configuration(self) -> SimpleNamespace:
+        self._wait()
+        payload = self._configuration
+        cfg = SimpleNamespace(**payload)
+        cfg.num_qubits = payload.get("n_qubits")
+        cfg.to_dict = lambda: copy.deepcopy(payload)
+        return cfg
+
+    def properties(self) -> Optional[FakeProperties]:
+        self._wait()
+        if self._properties is None:
+            return None
+        return FakeProperties(self._properties)
+
+
+class FakeRuntimeService:
+    """
+    Drop-in for QiskitRuntimeService.backends() / .backend(name).
+
+    - latency: seconds slept on every simulated API call
+    - num_backends: how many backends to expose; fixtures are cycled and
+      renamed (`<name>_<i>`) when more backends than fixtures are requested
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[List[Dict[str, Any]]] = None,
+        num_backends: Optional[int] = None,
+        latency: float = 0.0,
+    ) -> None:
+        fixtures = fixtures if fixtures is not None else load_fixtures()
+        if num_backends is None:
+            num_backends = len(fixtures)
+
+        self._latency = latency
+        self._backends: Dict[str, FakeBackend] = {}
+        for i in range(num_backends):
+            fixture = fixtures[i % len(fixtures)]
+            if i >= len(fixtures):
+                fixture = dict(fixture, name=f"{fixture['name']}_{i}")
+                fixture["status"] = dict(fixture["status"], backend_name=fixture["name"])
+            self._backends[fixture["name"]] = FakeBackend(fixture, latency=latency)
+
+    def _wait(self) -> None:
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+    def backends(self) -> List[FakeBackend]:
+        self._wait()
+        return list(self._backends.values())
+
+    def backend(self, name: str) -> FakeBackend:
+        self._wait()
+        try:
+            return self._backends[name]
+        except KeyError:
+            raise KeyError(f"No backend matches the criteria: {name}") from None
+
+    def backend_names(self) -> List[str]:
+        return list(self._backends)
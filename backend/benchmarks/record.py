@@ -0,0 +1,56 @@
+"""
+Record backend payloads from a live account into benchmarks/fixtures/.
+
+    cd backend
+    python -m benchmarks.record ibm_brisbane ibm_torino
+
+Needs IBM_QUANTUM_API_TOKEN (same .env as the API). With no names, every
+backend visible to the account is recorded.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from typing import Any, Dict, Optional
+
+from benchmarks.fake_service import FIXTURES_DIR
+
+
+def _to_dict(obj: Any) -> Optional[Dict[str, Any]]:
+    if obj is None:
+        return None
+    return obj.to_dict()
+
+
+def record_backend(backend) -> Dict[str, Any]:
+    return {
+        "name": backend.name,
+        "status": _to_dict(backend.status()),
+        "configuration": _to_dict(backend.configuration()),
+        "properties": _to_dict(backend.properties()),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="backend names (default: all)")
+    parser.add_argument("--out", default=FIXTURES_DIR, help="fixture directory")
+    args = parser.parse_args(argv)
+
+    from qiskit_client import IBMQuantumClient
+
+    service = IBMQuantumClient()._service
+    backends = [service.backend(n) for n in args.names] or list(service.backends())
+
+    os.makedirs(args.out, exist_ok=True)
+    for be in backends:
+        path = os.path.join(args.out, f"{be.name}.json")
+        with open(path, "w") as f:
+            # datetimes / complex values in the payloads are stored as strings
+            json.dump(record_backend(be), f, default=str)
+        print(f"recorded {be.name} -> {path}")
+
+
+if __name__ == "__main__":
+    main()
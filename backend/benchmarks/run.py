@@ -0,0 +1,350 @@
+"""
+Offline benchmark suite for the tracker API.
+
+Runs every hot path against the fixture-replay fake service (no IBM token
+needed) and writes one JSON document that can be diffed between runs:
+
+    cd backend
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --output after.json --compare bench.json
+
+All timings are in milliseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+import history
+from benchmarks._util import _free_port, _stats
+from benchmarks.fake_service import FakeRuntimeService
+from benchmarks.startup import bench_startup
+from qiskit_client import IBMQuantumClient
+
+SCHEMA_VERSION = 1
+
+HTTP_ENDPOINTS = [
+    "/api/backends",
+    "/api/summary",
+    "/api/top?n=5",
+    "/api/recommendation?min_qubits=5",
+    "/api/history?backend_name={name}&limit=200",
+    "/api/predict_wait?backend_name={name}",
+    "/api/backends/{name}/details",
+    "/api/backends/{name}/analytics?history_limit=300",
+]
+
+
+# -------------------------------------------------------------------
+# timing helpers
+# -------------------------------------------------------------------
+def _time(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return _stats(samples)
+
+
+def _snapshot_items(client: IBMQuantumClient) -> List[Dict[str, Any]]:
+    ok, statuses, err = client.get_statuses(force=True)
+    if not ok:
+        raise RuntimeError(f"fake service refresh failed: {err}")
+    return [s.to_dict() for s in statuses]
+
+
+def _seed_history(items: List[Dict[str, Any]], snapshots: int, start: int) -> None:
+    for i in range(snapshots):
+        rows = [dict(it, queue_length=(it["queue_length"] or 0) + (i * 7) % 50) for it in items]
+        history.save_snapshots(start + i * history._snapshot_interval, rows)
+
+
+def _restore_db(template: str, tmpdir: str, group: str) -> None:
+    # every group starts from the same seeded DB, so one group's writes
+    # (or --only / --repeat) never change another group's numbers
+    path = os.path.join(tmpdir, f"{group}.db")
+    shutil.copyfile(template, path)
+    history.DB_PATH = path
+    history._queue_stats.clear()
+
+
+# -------------------------------------------------------------------
+# client paths
+# -------------------------------------------------------------------
+def bench_client(client: IBMQuantumClient, name: str, repeat: int) -> Dict[str, Any]:
+    queue_stats = history.queue_analytics(name, limit=300)
+    return {
+        "refresh": _time(client._refresh, repeat),
+        "get_backend_details": _time(lambda: client.get_backend_details(name), repeat),
+        "get_backend_analytics": _time(
+            lambda: client.get_backend_analytics(name, queue_stats), repeat
+        ),
+    }
+
+
+# -------------------------------------------------------------------
+# SQLite history
+# -------------------------------------------------------------------
+def bench_history(items: List[Dict[str, Any]], name: str, repeat: int) -> Dict[str, Any]:
+    t = [int(time.time()) + 10**6]
+
+    def save() -> None:
+        t[0] += history._snapshot_interval
+        history.save_snapshots(t[0], items)
+
+    def queue_analytics_cold() -> None:
+        history._queue_stats.clear()
+        history.queue_analytics(name, 2000)
+
+    history.queue_analytics(name, 2000)
+    return {
+        "save_snapshots": _time(save, repeat),
+        "query_history_200": _time(lambda: history.query_history(name, 200), repeat),
+        "query_history_2000": _time(lambda: history.query_history(name, 2000), repeat),
+        "queue_analytics_2000_cold": _time(queue_analytics_cold, repeat),
+        "queue_analytics_2000_cached": _time(lambda: history.queue_analytics(name, 2000), repeat),
+    }
+
+
+# -------------------------------------------------------------------
+# SSE fan-out: one snapshot broadcast until every subscriber got it
+# -------------------------------------------------------------------
+async def _sse_fanout(subscribers: int, items: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    payload = {"type": "snapshot", "time": int(time.time()), "items": items}
+    received = 0
+    done = asyncio.Event()
+
+    async def consume() -> None:
+        nonlocal received
+        gen = history.event_generator()
+        try:
+            async for _ in gen:
+                received += 1
+                if received == subscribers:
+                    done.set()
+        finally:
+            await gen.aclose()
+
+    tasks = [asyncio.create_task(consume()) for _ in range(subscribers)]
+    while len(history._clients) < subscribers:
+        await asyncio.sleep(0)
+
+    samples = []
+    for i in range(repeat + 1):
+        received = 0
+        done.clear()
+        t0 = time.perf_counter()
+        await history._broadcast(payload)
+        await done.wait()
+        if i:  # first round is warm-up
+            samples.append(time.perf_counter() - t0)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return _stats(samples)
+
+
+def bench_sse(items: List[Dict[str, Any]], subscribers: List[int], repeat: int) -> Dict[str, Any]:
+    return {
+        f"fanout_{n}_subscribers": asyncio.run(_sse_fanout(n, items, repeat))
+        for n in subscribers
+    }
+
+
+# -------------------------------------------------------------------
+# HTTP endpoints under concurrent load (real uvicorn on localhost)
+# -------------------------------------------------------------------
+def _start_server(client: IBMQuantumClient):
+    import uvicorn
+
+    import main
+
+    async def _no_snapshot_loop(get_client) -> None:
+        # a forced refresh + save in the middle of the load would skew timings
+        return None
+
+    main._client = client
+    main._snapshot_loop = _no_snapshot_loop
+    config = uvicorn.Config(main.app, host="127.0.0.1", port=_free_port(), log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 30
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("uvicorn did not start within 30s")
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{config.port}"
+
+
+def _get(url: str) -> float:
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=60) as resp:
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"GET {url} -> {resp.status}")
+    return time.perf_counter() - t0
+
+
+def bench_http(
+    client: IBMQuantumClient, name: str, concurrency: int, requests: int
+) -> Dict[str, Any]:
+    server, thread, base = _start_server(client)
+    results: Dict[str, Any] = {}
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for path in HTTP_ENDPOINTS:
+                url = base + path.format(name=name)
+                list(pool.map(_get, [url] * concurrency))  # warm-up
+                t0 = time.perf_counter()
+                samples = list(pool.map(_get, [url] * requests))
+                wall = time.perf_counter() - t0
+                stats = _stats(samples)
+                stats["requests_per_s"] = round(requests / wall, 2)
+                results[path.split("?")[0]] = stats
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+    return results
+
+
+# -------------------------------------------------------------------
+# comparison / entrypoint
+# -------------------------------------------------------------------
+def _mismatches(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    problems = []
+    if baseline.get("schema") != current["schema"]:
+        problems.append(f"schema: {baseline.get('schema')} != {current['schema']}")
+    cur_params = current["meta"]["params"]
+    base_params = baseline.get("meta", {}).get("params", {})
+    for key in sorted(set(cur_params) | set(base_params)):
+        if cur_params.get(key) != base_params.get(key):
+            problems.append(f"params.{key}: {base_params.get(key)!r} != {cur_params.get(key)!r}")
+    return problems
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Median ratios per benchmark. Raises ValueError when the two runs used
+    a different schema or different parameters, since their numbers don't
+    measure the same thing.
+    """
+    problems = _mismatches(current, baseline)
+    if problems:
+        raise ValueError("runs are not comparable: " + "; ".join(problems))
+
+    lines = []
+    for group, benches in current["results"].items():
+        base_group = baseline.get("results", {}).get(group, {})
+        for bench, stats in benches.items():
+            base = base_group.get(bench)
+            if not base or not base.get("median_ms"):
+                continue
+            ratio = stats["median_ms"] / base["median_ms"]
+            lines.append(
+                f"{group}.{bench}: {base['median_ms']:.3f} -> {stats['median_ms']:.3f} ms"
+                f" (x{ratio:.2f})"
+            )
+    return lines
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    service = FakeRuntimeService(num_backends=args.backends, latency=args.latency)
+    client = IBMQuantumClient(service=service)
+    name = service.backend_names()[0]
+    only = set(args.only or [])
+
+    tmpdir = tempfile.mkdtemp(prefix="qjt-bench-")
+    template = os.path.join(tmpdir, "seed.db")
+    history.DB_PATH = template
+    history.init_db()
+    items = _snapshot_items(client)
+    _seed_history(items, args.history_snapshots, int(time.time()) - args.history_snapshots * history._snapshot_interval)
+
+    results: Dict[str, Any] = {}
+    if not only or "client" in only:
+        _restore_db(template, tmpdir, "client")
+        results["client"] = bench_client(client, name, args.repeat)
+    if not only or "history" in only:
+        _restore_db(template, tmpdir, "history")
+        results["history"] = bench_history(items, name, args.repeat)
+    if not only or "sse" in only:
+        results["sse"] = bench_sse(items, args.sse_subscribers, args.repeat)
+    if not only or "http" in only:
+        _restore_db(template, tmpdir, "http")
+        results["http"] = bench_http(client, name, args.concurrency, args.requests)
+    if not only or "startup" in only:
+        results["startup"] = bench_startup(args.startup_repeat)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "created": int(time.time()),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "params": {
+                "backends": args.backends,
+                "latency_s": args.latency,
+                "repeat": args.repeat,
+                "history_snapshots": args.history_snapshots,
+                "sse_subscribers": args.sse_subscribers,
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+                "startup_repeat": args.startup_repeat,
+            },
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Offline benchmarks against the fake IBM service")
+    parser.add_argument("--backends", type=int, default=20, help="number of fake backends")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per fake API call")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per micro-benchmark")
+    parser.add_argument("--history-snapshots", type=int, default=2000, help="snapshots seeded per backend")
+    parser.add_argument("--sse-subscribers", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--concurrency", type=int, default=16, help="parallel HTTP clients")
+    parser.add_argument("--requests", type=int, default=200, help="HTTP requests per endpoint")
+    parser.add_argument("--startup-repeat", type=int, default=5, help="fresh processes per startup benchmark")
+    parser.add_argument("--only", nargs="+", choices=["client", "history", "sse", "http", "startup"])
+    parser.add_argument("--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON to compare medians against")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        try:
+            lines = compare(report, baseline)
+        except ValueError as e:
+            sys.exit(f"--compare {args.compare}: {e}")
+        for line in lines:
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
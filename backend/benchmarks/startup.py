@@ -0,0 +1,163 @@
+"""
+Cold-start benchmarks, each sample in a fresh interpreter:
+
+- import_main: time to `import main`, and whether that loaded qiskit
+- ttfb_history: process spawn -> first byte of /api/history from uvicorn
+- ttfb_history_qiskit_loading / history_while_qiskit_loading: the same, but
+  the first snapshot pass really imports qiskit_ibm_runtime (then talks to
+  the fake service), as in production; the second entry is the latency of
+  /api/history requests made while that CPU-bound import runs
+
+Runs with an empty IBM_QUANTUM_API_TOKEN so no live service is contacted.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Tuple
+
+from benchmarks._util import _free_port, _stats
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+elapsed = time.perf_counter() - t0
+print(json.dumps({"seconds": elapsed, "qiskit_loaded": "qiskit_ibm_runtime" in sys.modules}))
+"""
+
+# uvicorn with the client construction swapped for "import the real qiskit
+# stack, then use the fake service"; argv[1] is the port
+_QISKIT_LOADING_SERVER = """
+import sys
+import uvicorn
+import main
+import qiskit_client
+from benchmarks.fake_service import FakeRuntimeService
+
+class _LoadingClient(qiskit_client.IBMQuantumClient):
+    def __init__(self):
+        import qiskit_ibm_runtime
+        super().__init__(service=FakeRuntimeService())
+
+qiskit_client.IBMQuantumClient = _LoadingClient
+uvicorn.run(main.app, host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+"""
+
+# how long to keep probing /api/history after the first byte (the qiskit
+# import takes ~1-2s)
+_LOAD_WINDOW = 3.0
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # set-but-empty wins over backend/.env (load_dotenv doesn't override)
+    env["IBM_QUANTUM_API_TOKEN"] = ""
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BACKEND_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def bench_import(repeat: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    qiskit_loaded = False
+    with tempfile.TemporaryDirectory(prefix="qjt-bench-") as cwd:
+        for i in range(repeat + 1):
+            out = subprocess.run(
+                [sys.executable, "-c", _IMPORT_SNIPPET],
+                cwd=cwd, env=_env(), check=True, capture_output=True, text=True,
+            ).stdout
+            res = json.loads(out.strip().splitlines()[-1])
+            qiskit_loaded = qiskit_loaded or res["qiskit_loaded"]
+            if i:  # first run only warms the bytecode cache
+                samples.append(res["seconds"])
+    stats = _stats(samples)
+    stats["qiskit_loaded"] = qiskit_loaded
+    return stats
+
+
+def _first_byte(proc: subprocess.Popen, url: str, deadline: float) -> None:
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=5) as resp:
+                resp.read(1)
+                return
+        except (urllib.error.URLError, ConnectionError):
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited with {proc.returncode} before serving {url}")
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"no response from {url}")
+            time.sleep(0.005)
+
+
+def _get_seconds(url: str) -> float:
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        resp.read()
+    return time.perf_counter() - t0
+
+
+def _probe_server(
+    cmd: List[str], repeat: int, follow_up: float = 0.0
+) -> Tuple[List[float], List[float]]:
+    """
+    Spawn `cmd` (gets the port appended) `repeat + 1` times; returns the
+    spawn -> first byte times and the latencies of /api/history requests
+    sent back-to-back for `follow_up` seconds after that first byte.
+    """
+    ttfb: List[float] = []
+    follow: List[float] = []
+    with tempfile.TemporaryDirectory(prefix="qjt-bench-") as cwd:
+        for i in range(repeat + 1):
+            port = _free_port()
+            url = f"http://127.0.0.1:{port}/api/history?backend_name=ibm_brisbane"
+            t0 = time.perf_counter()
+            proc = subprocess.Popen(
+                cmd + [str(port)],
+                cwd=cwd, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            try:
+                _first_byte(proc, url, t0 + 60)
+                first = time.perf_counter()
+                end = first + follow_up
+                latencies = []
+                while time.perf_counter() < end:
+                    latencies.append(_get_seconds(url))
+                if i:  # first spawn only warms the bytecode cache
+                    ttfb.append(first - t0)
+                    follow.extend(latencies)
+            finally:
+                proc.terminate()
+                proc.wait(timeout=10)
+    return ttfb, follow
+
+
+def bench_ttfb(repeat: int) -> Dict[str, Any]:
+    cmd = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+           "--log-level", "warning", "--port"]
+    ttfb, _ = _probe_server(cmd, repeat)
+    return _stats(ttfb)
+
+
+def bench_ttfb_qiskit_loading(repeat: int) -> Dict[str, Any]:
+    cmd = [sys.executable, "-c", _QISKIT_LOADING_SERVER]
+    ttfb, follow = _probe_server(cmd, repeat, follow_up=_LOAD_WINDOW)
+    return {
+        "ttfb_history_qiskit_loading": _stats(ttfb),
+        "history_while_qiskit_loading": _stats(follow),
+    }
+
+
+def bench_startup(repeat: int) -> Dict[str, Any]:
+    return {
+        "import_main": bench_import(repeat),
+        "ttfb_history": bench_ttfb(repeat),
+        **bench_ttfb_qiskit_loading(repeat),
+    }
@@ -1,14 +1,26 @@
 import asyncio
 import sqlite3
+import threading
 import time
 import json
-from typing import Dict, Any, List, Optional
+from collections import Counter, OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
 
 DB_PATH = "history.db"
 _snapshot_interval = int(30)  # seconds
 
 _clients: List[asyncio.Queue] = []
 
+# queue analytics cache: one _BackendQueueStats per backend
+_TIMELINE_BUCKET = 300  # seconds per queue_timeline point
+_QUEUE_WINDOWS = (300, 2000)  # kept as running sums; the largest caps `limit`
+_MAX_CACHED_STATS = 64
+_queue_stats: "OrderedDict[str, _BackendQueueStats]" = OrderedDict()
+_queue_stats_lock = threading.Lock()
+# recent saves, replayed into stats seeded while they landed
+_save_seq = 0
+_recent_saves: deque = deque(maxlen=32)  # (snapshot_time, {name: [items]})
+
 def init_db():
     con = sqlite3.connect(DB_PATH)
     cur = con.cursor()
@@ -26,6 +38,7 @@ def init_db():
     );
     CREATE INDEX IF NOT EXISTS idx_snapshot_time ON backend_snapshot(snapshot_time);
     CREATE INDEX IF NOT EXISTS idx_backend_name ON backend_snapshot(name);
+    CREATE INDEX IF NOT EXISTS idx_backend_name_time ON backend_snapshot(name, snapshot_time);
     """)
     con.commit()
     con.close()
@@ -46,6 +59,7 @@ def save_snapshots(snapshot_time: int, items: List[Dict[str,Any]]):
         ))
     con.commit()
     con.close()
+    _update_queue_stats(snapshot_time, items)
 
 def query_history(backend_name: str, limit: int = 200):
     con = sqlite3.connect(DB_PATH)
@@ -61,27 +75,206 @@ def query_history(backend_name: str, limit: int = 200):
     con.close()
     return [{ "snapshot_time": r[0], "queue_length": r[1], "num_qubits": r[2], "operational": r[3] } for r in rows][::-1]
 
-async def _snapshot_loop(client):
+class _QueueStats:
+    """
+    Queue statistics over the newest `window` snapshots of one backend.
+    Every aggregate is a running sum, so adding a snapshot (and evicting
+    the oldest one) is O(1) and reading never rescans the rows.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.rows: deque = deque()  # (snapshot_time, queue_length, operational)
+        self.operational = 0
+        self.queue_counts: Counter = Counter()  # queue_length -> samples
+        self.buckets: Dict[int, List[int]] = {}  # bucket start -> [sum, count]
+        self.heatmap = [[[0, 0] for _ in range(24)] for _ in range(7)]  # [weekday][hour]
+
+    def add(self, snapshot_time: int, queue_length: Optional[int], operational: Any):
+        row = (snapshot_time, queue_length, bool(operational))
+        if self.rows and snapshot_time < self.rows[-1][0]:
+            # back-dated row (clock stepped back): keep rows time-ordered so
+            # eviction drops the oldest snapshot, like a fresh seed would
+            i = len(self.rows)
+            while i and self.rows[i - 1][0] > snapshot_time:
+                i -= 1
+            self.rows.insert(i, row)
+        else:
+            self.rows.append(row)
+        self._apply(row, 1)
+        while len(self.rows) > self.window:
+            self._apply(self.rows.popleft(), -1)
+
+    def _apply(self, row, sign: int):
+        snapshot_time, queue_length, operational = row
+        if operational:
+            self.operational += sign
+        if queue_length is None:
+            return
+
+        self.queue_counts[queue_length] += sign
+        if not self.queue_counts[queue_length]:
+            del self.queue_counts[queue_length]
+
+        start = snapshot_time - snapshot_time % _TIMELINE_BUCKET
+        bucket = self.buckets.setdefault(start, [0, 0])
+        bucket[0] += sign * queue_length
+        bucket[1] += sign
+        if not bucket[1]:
+            del self.buckets[start]
+
+        t = time.gmtime(snapshot_time)
+        cell = self.heatmap[t.tm_wday][t.tm_hour]
+        cell[0] += sign * queue_length
+        cell[1] += sign
+
+    def _percentile(self, pct: float) -> Optional[int]:
+        total = sum(self.queue_counts.values())
+        if not total:
+            return None
+        rank = max(1, -(-total * pct // 100))  # nearest-rank
+        seen = 0
+        for value in sorted(self.queue_counts):
+            seen += self.queue_counts[value]
+            if seen >= rank:
+                return value
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        def avg(total, count):
+            return round(total / count, 2) if count else None
+
+        samples = sum(self.queue_counts.values())
+        queue_sum = sum(v * c for v, c in self.queue_counts.items())
+        hours = [[sum(self.heatmap[d][h][i] for d in range(7)) for i in (0, 1)] for h in range(24)]
+        days = [[sum(self.heatmap[d][h][i] for h in range(24)) for i in (0, 1)] for d in range(7)]
+
+        return {
+            "snapshots": len(self.rows),
+            "from_time": self.rows[0][0] if self.rows else None,
+            "to_time": self.rows[-1][0] if self.rows else None,
+            "bucket_seconds": _TIMELINE_BUCKET,
+            "timeline": [
+                {"slot": i, "time": start, "queue": avg(*self.buckets[start]), "samples": self.buckets[start][1]}
+                for i, start in enumerate(sorted(self.buckets))
+            ],
+            "queue_avg": avg(queue_sum, samples),
+            "queue_p50": self._percentile(50),
+            "queue_p95": self._percentile(95),
+            "queue_max": max(self.queue_counts) if self.queue_counts else None,
+            "uptime_pct": round(100.0 * self.operational / len(self.rows), 2) if self.rows else None,
+            # UTC; day_of_week starts on Monday
+            "heatmap": {
+                "hour_of_day": [avg(*c) for c in hours],
+                "day_of_week": [avg(*c) for c in days],
+                "day_hour": [[avg(*c) for c in row] for row in self.heatmap],
+            },
+        }
+
+class _BackendQueueStats:
+    """
+    Running _QueueStats for each of _QUEUE_WINDOWS over one backend. Any
+    other limit is computed exactly from the newest rows of the largest
+    window (in memory, already time-ordered), never from SQLite.
+    """
+
+    def __init__(self):
+        self.windows = {w: _QueueStats(w) for w in _QUEUE_WINDOWS}
+
+    def add(self, snapshot_time: int, queue_length: Optional[int], operational: Any):
+        for stats in self.windows.values():
+            stats.add(snapshot_time, queue_length, operational)
+
+    def to_dict(self, limit: int) -> Dict[str, Any]:
+        stats = self.windows.get(limit)
+        if stats is None:
+            largest = self.windows[_QUEUE_WINDOWS[-1]]
+            stats = _QueueStats(limit)
+            for row in list(largest.rows)[-limit:]:
+                stats.add(*row)
+        return stats.to_dict()
+
+def _add_items(stats: _BackendQueueStats, snapshot_time: int, items: List[Dict[str,Any]]):
+    for it in items:
+        stats.add(snapshot_time, it.get("queue_length"), it.get("operational"))
+
+def _update_queue_stats(snapshot_time: int, items: List[Dict[str,Any]]):
+    global _save_seq
+    # one pass over the snapshot, then one cache lookup per backend in it
+    by_name: Dict[str, List[Dict[str,Any]]] = {}
+    for it in items:
+        by_name.setdefault(it.get("name"), []).append(it)
+    with _queue_stats_lock:
+        _save_seq += 1
+        _recent_saves.append((snapshot_time, by_name))
+        for name, rows in by_name.items():
+            stats = _queue_stats.get(name)
+            if stats is not None:
+                _add_items(stats, snapshot_time, rows)
+
+def queue_analytics(backend_name: str, limit: int = 300) -> Dict[str,Any]:
+    limit = max(1, min(limit, _QUEUE_WINDOWS[-1]))
+    key = backend_name
+    while True:
+        with _queue_stats_lock:
+            stats = _queue_stats.get(key)
+            if stats is not None:
+                _queue_stats.move_to_end(key)
+                return stats.to_dict(limit)
+            seq = _save_seq
+
+        # seed from the (name, snapshot_time) index without holding the lock,
+        # so save_snapshots (event loop) and other backends never wait on it
+        rows = query_history(backend_name, _QUEUE_WINDOWS[-1])
+        stats = _BackendQueueStats()
+        for r in rows:
+            stats.add(r["snapshot_time"], r["queue_length"], r["operational"])
+        seeded_times = {r["snapshot_time"] for r in rows}
+
+        with _queue_stats_lock:
+            existing = _queue_stats.get(key)
+            if existing is not None:
+                return existing.to_dict(limit)
+            missed = _save_seq - seq
+            if missed > len(_recent_saves):
+                continue  # too many saves landed meanwhile, seed again
+            # replay saves since `seq`; those already committed before the
+            # query are in `rows` and are skipped by their timestamp
+            for snapshot_time, by_name in list(_recent_saves)[len(_recent_saves) - missed:]:
+                if snapshot_time not in seeded_times:
+                    _add_items(stats, snapshot_time, by_name.get(backend_name, []))
+            if not stats.windows[_QUEUE_WINDOWS[-1]].rows:
+                # unknown / never-snapshotted name: don't let it take (and
+                # evict) an LRU slot from a real backend
+                return stats.to_dict(limit)
+            _queue_stats[key] = stats
+            while len(_queue_stats) > _MAX_CACHED_STATS:
+                _queue_stats.popitem(last=False)
+            return stats.to_dict(limit)
+
+async def _broadcast(payload: Dict[str,Any]):
+    data = json.dumps(payload)
+    for q in list(_clients):
+        try:
+            await q.put(data)
+        except Exception:
+            pass
+
+async def _snapshot_loop(build_client):
     while True:
         try:
-            ok, statuses, err = client.get_statuses(force=True)
+            # client construction and status refresh are blocking network
+            # calls, keep them off the event loop
+            ok, statuses, err = await asyncio.to_thread(
+                lambda: build_client().get_statuses(force=True)
+            )
             snapshot_time = int(time.time())
             if ok and statuses:
                 items = [s.to_dict() for s in statuses]
                 save_snapshots(snapshot_time, items)
-                payload = {"type":"snapshot", "time": snapshot_time, "items": items}
-                for q in list(_clients):
-                    try:
-                        await q.put(json.dumps(payload))
-                    except Exception:
-                        pass
+                await _broadcast({"type":"snapshot", "time": snapshot_time, "items": items})
         except Exception as e:
-            payload = {"type":"error", "error": str(e)}
-            for q in list(_clients):
-                try:
-                    await q.put(json.dumps(payload))
-                except Exception:
-                    pass
+            await _broadcast({"type":"error", "error": str(e)})
         await asyncio.sleep(_snapshot_interval)
 
 async def event_generator():
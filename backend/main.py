@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import os
 import asyncio
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from fastapi import FastAPI, Query, Response, Body
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 
-from qiskit_client import IBMQuantumClient
-from history import init_db, _snapshot_loop, event_generator, query_history
+from history import init_db, _snapshot_loop, event_generator, query_history, queue_analytics
+
+# qiskit_client (and the qiskit stack behind it) is imported on first use so
+# the process can bind its port and serve history endpoints straight away.
+if TYPE_CHECKING:
+    from qiskit_client import IBMQuantumClient
 
 load_dotenv()
 
@@ -25,38 +30,99 @@ app.add_middleware(
 )
 
 _client = None
+_client_error: Optional[str] = None
+_client_lock = threading.Lock()
+# set once the current (or last) construction attempt has finished
+_client_attempt: Optional[threading.Event] = None
+# how long a request waits for an in-flight construction before giving up
+_CLIENT_WAIT = float(os.getenv("CLIENT_WAIT_SECONDS", "15"))
+
+def _build(attempt: threading.Event) -> None:
+    global _client, _client_error
+    try:
+        from qiskit_client import IBMQuantumClient
+        _client = IBMQuantumClient()
+        _client_error = None
+    except Exception as e:
+        _client_error = f"IBM Quantum client unavailable: {e}"
+    finally:
+        attempt.set()
 
-def get_client() -> IBMQuantumClient:
-    global _client
+def _start_build() -> threading.Event:
+    """
+    Return the in-flight construction attempt, starting one in a background
+    thread if none is running and the client doesn't exist yet (first call,
+    or the last attempt failed). Concurrent callers share a single attempt.
+    """
+    global _client_attempt
+    with _client_lock:
+        if _client_attempt is None or (_client_attempt.is_set() and _client is None):
+            _client_attempt = threading.Event()
+            threading.Thread(target=_build, args=(_client_attempt,), daemon=True).start()
+        return _client_attempt
+
+def build_client() -> IBMQuantumClient:
+    """Used by the snapshot loop: waits for construction, raises on failure."""
     if _client is None:
-        _client = IBMQuantumClient()
+        _start_build().wait()
+    if _client is None:
+        raise RuntimeError(_client_error)
     return _client
 
+def get_client() -> Tuple[Optional[IBMQuantumClient], Optional[str]]:
+    """
+    Client for request handlers. While the client is being built (cold
+    start) this waits up to CLIENT_WAIT_SECONDS; after a failed attempt it
+    starts a fresh one, so a transient error doesn't lock requests out
+    until the next snapshot pass.
+    """
+    if _client is None:
+        attempt = _start_build()
+        attempt.wait(_CLIENT_WAIT)
+        if _client is None:
+            if not attempt.is_set():
+                return None, "IBM Quantum client is still starting up"
+            return None, _client_error
+    return _client, None
+
 @app.on_event("startup")
 async def startup_tasks():
     init_db()
-    # start snapshot loop
+    # start snapshot loop; its first pass builds the client and warms the
+    # status cache in the background instead of blocking startup
     loop = asyncio.get_event_loop()
-    loop.create_task(_snapshot_loop(get_client()))
+    loop.create_task(_snapshot_loop(build_client))
 
 @app.get("/api/backends")
 def backends(force: bool = Query(False, description="Bypass cache and refresh")):
-    ok, statuses, err = get_client().get_statuses(force=force)
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": [], "error": err}
+    ok, statuses, err = client.get_statuses(force=force)
     return {"ok": ok, "data": [s.to_dict() for s in statuses], "error": err}
 
 @app.get("/api/summary")
 def summary():
-    ok, data, err = get_client().summary()
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": {}, "error": err}
+    ok, data, err = client.summary()
     return {"ok": ok, "data": data, "error": err}
 
 @app.get("/api/top")
 def top(n: int = Query(5, ge=1, le=50)):
-    ok, data, err = get_client().top_busiest(n=n)
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": [], "error": err}
+    ok, data, err = client.top_busiest(n=n)
     return {"ok": ok, "data": [s.to_dict() for s in data], "error": err}
 
 @app.get("/api/recommendation")
 def recommendation(min_qubits: int = Query(0, ge=0), max_queue: Optional[int] = Query(None, ge=0)):
-    ok, rec, err = get_client().recommend_backend(min_qubits=min_qubits, max_queue=max_queue)
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": None, "error": err}
+    ok, rec, err = client.recommend_backend(min_qubits=min_qubits, max_queue=max_queue)
     return {"ok": ok, "data": (rec.to_dict() if rec else None), "error": err}
 
 @app.get("/api/history")
@@ -84,7 +150,10 @@ def backend_details(backend_name: str):
     Full config + status + calibration of a single backend.
     Used for the 'Details' tab in your frontend.
     """
-    ok, data, err = get_client().get_backend_details(backend_name)
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": None, "error": err}
+    ok, data, err = client.get_backend_details(backend_name)
     return {"ok": ok, "data": data, "error": err}
 
 
@@ -97,7 +166,11 @@ def backend_analytics(
     Analytics view combining calibrations (T1/T2/error) and queue history.
     Used for the 'Analytics' tab in your frontend.
     """
-    # Get history from SQLite
-    history_rows = query_history(backend_name, limit=history_limit)
-    ok, data, err = get_client().get_backend_analytics(backend_name, history_rows)
+    # Queue stats over the last `history_limit` snapshots (cached per
+    # backend, kept current as new snapshots are saved)
+    client, err = get_client()
+    if client is None:
+        return {"ok": False, "data": None, "error": err}
+    queue_stats = queue_analytics(backend_name, limit=history_limit)
+    ok, data, err = client.get_backend_analytics(backend_name, queue_stats)
     return {"ok": ok, "data": data, "error": err}
@@ -3,11 +3,15 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
 
 from dotenv import load_dotenv
-from qiskit_ibm_runtime import QiskitRuntimeService
-from qiskit_ibm_runtime.ibm_backend import IBMBackend
+
+# qiskit_ibm_runtime pulls in the whole qiskit stack (seconds of import
+# time), so it is only imported when a real service is constructed.
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import QiskitRuntimeService
+    from qiskit_ibm_runtime.ibm_backend import IBMBackend
 
 load_dotenv()
 
@@ -45,19 +49,30 @@ class IBMQuantumClient:
     - analytics extracted from backend properties()
     """
 
-    def __init__(self, cache_ttl: int = 30) -> None:
-        token = os.getenv("IBM_QUANTUM_API_TOKEN")
-        instance = os.getenv("IBM_QUANTUM_INSTANCE") or None
-
-        if not token:
-            raise RuntimeError("Missing IBM_QUANTUM_API_TOKEN in environment")
+    def __init__(
+        self,
+        cache_ttl: int = 30,
+        service: Optional[QiskitRuntimeService] = None,
+    ) -> None:
+        # `service` lets callers (e.g. the offline benchmarks) inject an
+        # already-built service instead of connecting with the env token.
+        if service is None:
+            token = os.getenv("IBM_QUANTUM_API_TOKEN")
+            instance = os.getenv("IBM_QUANTUM_INSTANCE") or None
+
+            if not token:
+                raise RuntimeError("Missing IBM_QUANTUM_API_TOKEN in environment")
+
+            from qiskit_ibm_runtime import QiskitRuntimeService
+
+            # IMPORTANT: use "ibm_quantum_platform" channel for new runtime
+            service = QiskitRuntimeService(
+                channel="ibm_quantum_platform",
+                token=token,
+                instance=instance,
+            )
 
-        # IMPORTANT: use "ibm_quantum_platform" channel for new runtime
-        self._service = QiskitRuntimeService(
-            channel="ibm_quantum_platform",
-            token=token,
-            instance=instance,
-        )
+        self._service = service
 
         self._ttl = int(os.getenv("CACHE_TTL", str(cache_ttl)))
         self._cache_time: float = 0.0
@@ -363,51 +378,38 @@ class IBMQuantumClient:
     # ---------------------------------------------------------------
     # NEW: BACKEND ANALYTICS
     # used by: /api/backends/{name}/analytics
-    # (no DB dependency – purely from backend properties)
+    # (queue statistics come precomputed from history.queue_analytics)
     # ---------------------------------------------------------------
     def get_backend_analytics(
-        self, backend_name: str, history_rows: int = 200
+        self, backend_name: str, queue_stats: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """
         Returns a rich analytics payload for charts:
         - per-qubit T1/T2 distribution
         - readout error distribution
         - 1q / 2q gate error distributions
-        - synthetic queue timeline (for sparkline style charts)
+        - queue timeline + queue stats from recorded snapshots
         """
         try:
             backend: IBMBackend = self._service.backend(backend_name)
         except Exception as e:
             return False, None, f"backend {backend_name} not found: {e}"
 
-        try:
-            status = backend.status()
-        except Exception:
-            status = None
-
         try:
             props = backend.properties()
         except Exception:
             props = None
 
+        queue_stats = dict(queue_stats or {})
+        queue_timeline: List[Dict[str, Any]] = queue_stats.pop("timeline", [])
+
         # If we have no properties at all, return a minimal analytics object
         if props is None:
-            queue_len = getattr(status, "pending_jobs", None) if status else None
-            synthetic_timeline = []
-            if isinstance(queue_len, int):
-                base = queue_len
-                for i in range(10):
-                    synthetic_timeline.append(
-                        {
-                            "slot": i,
-                            "queue": max(0, base - int(i * base / 9.0)),
-                        }
-                    )
-
             return (
                 True,
                 {
-                    "queue_timeline": synthetic_timeline,
+                    "queue_timeline": queue_timeline,
+                    "queue_stats": queue_stats,
                     "note": "No calibration properties available for this backend; analytics are limited.",
                 },
                 None,
@@ -495,27 +497,13 @@ class IBMQuantumClient:
             ),
         }
 
-        # synthetic queue timeline from current queue length (no DB)
-        queue_len = getattr(status, "pending_jobs", None) if status else None
-        queue_timeline: List[Dict[str, Any]] = []
-        if isinstance(queue_len, int):
-            base = queue_len
-            for i in range(12):
-                queue_timeline.append(
-                    {
-                        "slot": i,
-                        "queue": max(
-                            0, int(base - (base * 0.8 * i / 11.0))
-                        ),
-                    }
-                )
-
         analytics_payload: Dict[str, Any] = {
             "summary": analytics_summary,
             "t1_distribution": t1_distribution,
             "t2_distribution": t2_distribution,
             "readout_error_distribution": readout_distribution,
             "queue_timeline": queue_timeline,
+            "queue_stats": queue_stats,
         }
 
         return True, analytics_payload, None
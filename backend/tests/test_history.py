@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+import history
+
+NAME = "ibm_test"
+
+
+@pytest.fixture(autouse=True)
+def fresh_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "DB_PATH", str(tmp_path / "history.db"))
+    monkeypatch.setattr(history, "_queue_stats", history.OrderedDict())
+    monkeypatch.setattr(history, "_recent_saves", history.deque(maxlen=32))
+    monkeypatch.setattr(history, "_save_seq", 0)
+    history.init_db()
+
+
+def _save(rng, t, n):
+    for _ in range(n):
+        t += history._snapshot_interval
+        history.save_snapshots(t, [
+            {
+                "name": NAME,
+                "queue_length": rng.choice([None, 0, 3, 17, 40, 250]),
+                "operational": rng.random() < 0.8,
+            },
+            {"name": "other", "queue_length": 1, "operational": True},
+        ])
+    return t
+
+
+def _cold(limit):
+    history._queue_stats.clear()
+    return history.queue_analytics(NAME, limit)
+
+
+@pytest.mark.parametrize("limit", [50, 300, 2000])
+def test_incremental_matches_cold_recompute(limit):
+    rng = random.Random(limit)
+    t = _save(rng, 1_760_000_000, 400)
+    history.queue_analytics(NAME, limit)
+    _save(rng, t, 137)  # enough to evict rows from the 300 window
+
+    cached = history.queue_analytics(NAME, limit)
+    assert cached == _cold(limit)
+
+
+def test_none_queue_lengths_and_uptime():
+    t = 1_760_000_000
+    history.save_snapshots(t, [{"name": NAME, "queue_length": None, "operational": True}])
+    history.save_snapshots(t + 30, [{"name": NAME, "queue_length": 10, "operational": False}])
+    history.queue_analytics(NAME)
+    history.save_snapshots(t + 60, [{"name": NAME, "queue_length": 20, "operational": True}])
+    history.save_snapshots(t + 90, [{"name": NAME, "queue_length": None, "operational": False}])
+
+    stats = history.queue_analytics(NAME)
+    assert stats["snapshots"] == 4
+    assert stats["uptime_pct"] == 50.0
+    assert stats["queue_avg"] == 15.0
+    assert (stats["queue_p50"], stats["queue_p95"], stats["queue_max"]) == (10, 20, 20)
+    assert sum(b["samples"] for b in stats["timeline"]) == 2
+    assert stats == _cold(300)
+
+
+def test_out_of_order_snapshot_is_kept():
+    t = 1_760_000_000
+    history.save_snapshots(t + 10**6, [{"name": NAME, "queue_length": 5, "operational": True}])
+    history.queue_analytics(NAME)
+    # clock stepped backwards: still a real row in SQLite
+    history.save_snapshots(t, [{"name": NAME, "queue_length": 7, "operational": True}])
+
+    stats = history.queue_analytics(NAME)
+    assert stats["snapshots"] == 2
+    assert stats == _cold(300)
+
+
+def test_seed_skips_rows_already_in_db():
+    rng = random.Random(1)
+    t = _save(rng, 1_760_000_000, 10)
+    # a save journaled after the seed started but committed before its query
+    history._save_seq -= 1
+    history.queue_analytics(NAME)
+    assert history.queue_analytics(NAME)["snapshots"] == 10
+
+
+@pytest.mark.parametrize("limit", [20, 150, 1000])
+def test_other_limits_are_exact(limit):
+    rng = random.Random(limit)
+    t = _save(rng, 1_760_000_000, 1100)
+    history.queue_analytics(NAME, limit)
+    _save(rng, t, 40)
+
+    expected = history._QueueStats(limit)
+    for r in history.query_history(NAME, limit):
+        expected.add(r["snapshot_time"], r["queue_length"], r["operational"])
+    stats = history.queue_analytics(NAME, limit)
+    assert stats["snapshots"] == limit
+    assert stats == expected.to_dict()
+    assert list(history._queue_stats) == [NAME]
+
+
+def test_lru_is_bounded(monkeypatch):
+    monkeypatch.setattr(history, "_MAX_CACHED_STATS", 3)
+    for i in range(5):
+        history.save_snapshots(1_760_000_000, [{"name": f"b{i}", "queue_length": i, "operational": True}])
+        history.queue_analytics(f"b{i}")
+    assert list(history._queue_stats) == ["b2", "b3", "b4"]
+
+
+def test_names_without_history_are_not_cached():
+    _save(random.Random(3), 1_760_000_000, 3)
+    history.queue_analytics(NAME)
+    for i in range(100):
+        assert history.queue_analytics(f"made_up_{i}")["snapshots"] == 0
+    assert list(history._queue_stats) == [NAME]